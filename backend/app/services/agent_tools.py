@@ -8,6 +8,7 @@ execute_tool() function that dispatches tool calls to existing services.
 import logging
 from datetime import date, datetime, timedelta, timezone
 from decimal import Decimal
+from types import MappingProxyType
 from typing import Any, Dict, List, Optional
 from uuid import uuid4
 
@@ -394,8 +395,14 @@ def _parse_date(date_str: Optional[str]) -> date:
     return date.today()
 
 
+# JSON-native leaf types, returned as-is before the isinstance checks below
+_PASSTHROUGH_TYPES = frozenset({str, int, float, bool, type(None)})
+
+
 def _serialize(obj: Any) -> Any:
     """Recursively convert non-JSON-serializable types."""
+    if type(obj) in _PASSTHROUGH_TYPES:
+        return obj
     if isinstance(obj, Decimal):
         return float(obj)
     if isinstance(obj, (date, datetime)):
@@ -832,8 +839,8 @@ _TOOL_EXECUTORS = {
     "create_exercise": _create_exercise,
 }
 
-# Human-readable action summaries for UI display
-_TOOL_ACTION_LABELS = {
+# Human-readable action summaries for UI display (read-only)
+_TOOL_ACTION_LABELS = MappingProxyType({
     "get_nutrition_summary": "Checked nutrition data",
     "search_foods": "Searched foods",
     "search_usda_foods": "Searched USDA database",
@@ -848,7 +855,7 @@ _TOOL_ACTION_LABELS = {
     "create_food": "Created custom food",
     "log_workout": "Logged workout",
     "create_exercise": "Created exercise",
-}
+})
 
 
 async def execute_tool(
@@ -12,14 +12,23 @@ Handles:
 import re
 from datetime import date, datetime, timedelta, timezone
 from decimal import Decimal
-from typing import Any, Optional
+from typing import TYPE_CHECKING, Any, Optional
 
 from app.core.logging_config import get_logger
 from app.services.supabase_client import SupabaseService, get_supabase_service
 
+if TYPE_CHECKING:
+    # postgrest ships with supabase; it is only needed for annotations
+    from postgrest import SyncSelectRequestBuilder
+
 # Regex to strip XML/HTML tags from exercise names
 _TAG_RE = re.compile(r"<[^>]+>")
 
+# Column projections for the exercise history and workout trends queries
+_HISTORY_SESSION_COLUMNS = "id, session_date"
+_TREND_SESSION_COLUMNS = "id, session_date, start_time, end_time"
+_TREND_SET_COLUMNS = "session_id, weight_kg, reps, distance_meters"
+
 logger = get_logger(__name__)
 
 
@@ -685,14 +694,9 @@ class WorkoutService:
         Returns per-date aggregations: max_weight, total_volume, total_reps, avg_rpe, total_sets.
         """
         # 1. Fetch sessions in range → get session IDs + date map
-        sessions_response = (
-            self.supabase.admin_client.table("workout_sessions")
-            .select("id, session_date")
-            .eq("user_id", user_id)
-            .gte("session_date", start_date.isoformat())
-            .lte("session_date", end_date.isoformat())
-            .execute()
-        )
+        sessions_response = self._sessions_in_range(
+            _HISTORY_SESSION_COLUMNS, user_id, start_date, end_date
+        ).execute()
 
         if not sessions_response.data:
             return []
@@ -767,14 +771,9 @@ class WorkoutService:
         Returns per-date aggregations: distance, duration, pace, heart rate, calories.
         """
         # 1. Fetch sessions in range
-        sessions_response = (
-            self.supabase.admin_client.table("workout_sessions")
-            .select("id, session_date")
-            .eq("user_id", user_id)
-            .gte("session_date", start_date.isoformat())
-            .lte("session_date", end_date.isoformat())
-            .execute()
-        )
+        sessions_response = self._sessions_in_range(
+            _HISTORY_SESSION_COLUMNS, user_id, start_date, end_date
+        ).execute()
 
         if not sessions_response.data:
             return []
@@ -858,11 +857,7 @@ class WorkoutService:
         """
         # 1. Fetch sessions in range
         sessions_response = (
-            self.supabase.admin_client.table("workout_sessions")
-            .select("id, session_date, start_time, end_time")
-            .eq("user_id", user_id)
-            .gte("session_date", start_date.isoformat())
-            .lte("session_date", end_date.isoformat())
+            self._sessions_in_range(_TREND_SESSION_COLUMNS, user_id, start_date, end_date)
             .order("session_date")
             .execute()
         )
@@ -875,7 +870,7 @@ class WorkoutService:
         # 2. Fetch all sets in those sessions
         sets_response = (
             self.supabase.admin_client.table("workout_sets")
-            .select("session_id, set_type, weight_kg, reps, distance_meters, duration_seconds")
+            .select(_TREND_SET_COLUMNS)
             .in_("session_id", session_ids)
             .execute()
         )
@@ -888,7 +883,9 @@ class WorkoutService:
                 sets_by_session[sid] = []
             sets_by_session[sid].append(s)
 
-        # 3. Group sessions by ISO week (Monday-based)
+        # 3. Group sessions by ISO week (Monday-based). Sessions arrive ordered
+        # by date, so weeks are appended to the result already sorted.
+        result: list[dict[str, Any]] = []
         week_data: dict[str, dict] = {}
         for session in sessions_response.data:
             session_date_obj = date.fromisoformat(session["session_date"])
@@ -896,11 +893,11 @@ class WorkoutService:
             iso_year, iso_week, _ = session_date_obj.isocalendar()
             week_key = f"{iso_year}-W{iso_week:02d}"
 
-            # Compute week_start (Monday)
-            week_start = session_date_obj - timedelta(days=session_date_obj.weekday())
-
-            if week_key not in week_data:
-                week_data[week_key] = {
+            agg = week_data.get(week_key)
+            if agg is None:
+                # Compute week_start (Monday)
+                week_start = session_date_obj - timedelta(days=session_date_obj.weekday())
+                agg = week_data[week_key] = {
                     "week": week_key,
                     "week_start": week_start.isoformat(),
                     "total_sessions": 0,
@@ -909,8 +906,8 @@ class WorkoutService:
                     "total_distance_meters": 0.0,
                     "total_duration_minutes": 0.0,
                 }
+                result.append(agg)
 
-            agg = week_data[week_key]
             agg["total_sessions"] += 1
 
             # Session duration
@@ -930,19 +927,11 @@ class WorkoutService:
                 if s.get("distance_meters") is not None:
                     agg["total_distance_meters"] += float(s["distance_meters"])
 
-        # 4. Finalize and sort by week
-        result = []
-        for week_key in sorted(week_data.keys()):
-            agg = week_data[week_key]
-            result.append({
-                "week": agg["week"],
-                "week_start": agg["week_start"],
-                "total_sessions": agg["total_sessions"],
-                "total_sets": agg["total_sets"],
-                "total_volume_kg": agg["total_volume_kg"] if agg["total_volume_kg"] > 0 else None,
-                "total_distance_meters": agg["total_distance_meters"] if agg["total_distance_meters"] > 0 else None,
-                "total_duration_minutes": round(agg["total_duration_minutes"], 1) if agg["total_duration_minutes"] > 0 else None,
-            })
+        # 4. Finalize: report empty totals as None
+        for agg in result:
+            agg["total_volume_kg"] = agg["total_volume_kg"] if agg["total_volume_kg"] > 0 else None
+            agg["total_distance_meters"] = agg["total_distance_meters"] if agg["total_distance_meters"] > 0 else None
+            agg["total_duration_minutes"] = round(agg["total_duration_minutes"], 1) if agg["total_duration_minutes"] > 0 else None
 
         return result
 
@@ -950,6 +939,18 @@ class WorkoutService:
     # HELPER METHODS
     # =========================================================================
 
+    def _sessions_in_range(
+        self, columns: str, user_id: str, start_date: date, end_date: date
+    ) -> "SyncSelectRequestBuilder":
+        """Build a workout_sessions query for a user's sessions in a date range."""
+        return (
+            self.supabase.admin_client.table("workout_sessions")
+            .select(columns)
+            .eq("user_id", user_id)
+            .gte("session_date", start_date.isoformat())
+            .lte("session_date", end_date.isoformat())
+        )
+
     def _compute_session_duration(self, session: dict[str, Any]) -> Optional[int]:
         """Compute session duration in minutes from start/end times."""
         start = session.get("start_time")
@@ -3,7 +3,7 @@
 import pytest
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def user_id():
     """Test user ID."""
     return "test-user-123"
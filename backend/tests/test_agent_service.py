@@ -85,7 +85,6 @@ class TestExtractText:
 
 
 class TestSendMessageAgenticLoop:
-    @pytest.mark.asyncio
     async def test_simple_text_response(self, service, mock_bedrock, user_id):
         """Test a simple response with no tool use."""
         mock_bedrock.converse = AsyncMock(
@@ -121,7 +120,6 @@ class TestSendMessageAgenticLoop:
         assert result["tool_actions"] == []
         mock_bedrock.converse.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_single_tool_use_then_response(self, service, mock_bedrock, user_id):
         """Test: model calls one tool, then responds with text."""
         call_count = 0
@@ -182,7 +180,6 @@ class TestSendMessageAgenticLoop:
         assert result["tool_actions"][0]["tool"] == "get_whoop_summary"
         assert result["message"]["content"] == "Your recovery is 85%."
 
-    @pytest.mark.asyncio
     async def test_multi_tool_use(self, service, mock_bedrock, user_id):
         """Test: model calls search_foods, then log_food_entry, then responds."""
         call_count = 0
@@ -265,7 +262,6 @@ class TestSendMessageAgenticLoop:
         assert result["tool_actions"][0]["tool"] == "search_foods"
         assert result["tool_actions"][1]["tool"] == "log_food_entry"
 
-    @pytest.mark.asyncio
     async def test_existing_conversation(self, service, mock_bedrock, user_id):
         """Test continuing an existing conversation."""
         mock_bedrock.converse = AsyncMock(
@@ -304,7 +300,6 @@ class TestSendMessageAgenticLoop:
         assert result["conversation_id"] == "conv-existing"
         service._get_conversation.assert_called_once_with("conv-existing", user_id)
 
-    @pytest.mark.asyncio
     async def test_conversation_not_found(self, service, user_id):
         """Test error when conversation doesn't exist."""
         service._get_conversation = MagicMock(return_value=None)
@@ -314,7 +309,6 @@ class TestSendMessageAgenticLoop:
                 user_id, "hello", conversation_id="bad-id"
             )
 
-    @pytest.mark.asyncio
     async def test_max_iterations_safety(self, service, mock_bedrock, user_id):
         """Test that the loop stops after MAX_TOOL_ITERATIONS and makes a final summary call."""
         call_count = 0
@@ -1,20 +1,74 @@
 """Tests for Bedrock Converse API client."""
 
+import asyncio
+import copy
 import pytest
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
 from botocore.exceptions import ClientError
 
+from app.services import bedrock_client
 from app.services.bedrock_client import BedrockClient, BedrockAPIError
 
 
+# converse() responses shared by the tests below, shaped like boto3's
+CONVERSE_TEXT_RESPONSE = {
+    "output": {
+        "message": {
+            "role": "assistant",
+            "content": [{"text": "Hello!"}],
+        },
+    },
+    "stopReason": "end_turn",
+}
+
+CONVERSE_TOOL_USE_RESPONSE = {
+    "output": {
+        "message": {
+            "role": "assistant",
+            "content": [
+                {
+                    "toolUse": {
+                        "toolUseId": "tool-1",
+                        "name": "get_whoop_summary",
+                        "input": {},
+                    },
+                },
+            ],
+        },
+    },
+    "stopReason": "tool_use",
+}
+
+# Error payload botocore attaches to a throttled converse() call
+THROTTLE_ERROR_RESPONSE = {
+    "Error": {"Code": "ThrottlingException", "Message": "Rate exceeded"},
+}
+
+
+def boto_stub(ret=None, exc=None):
+    """Fake boto3 bedrock-runtime client whose converse() returns ``ret`` or raises ``exc``.
+
+    Keyword arguments of each call are recorded in ``calls``.
+    """
+    calls = []
+
+    def converse(**kwargs):
+        calls.append(kwargs)
+        if exc is not None:
+            raise exc
+        return ret
+
+    return SimpleNamespace(converse=converse, calls=calls)
+
+
 @pytest.fixture
 def mock_settings():
-    settings = MagicMock()
-    settings.aws_access_key_id = "test-key"
-    settings.aws_secret_access_key = "test-secret"
-    settings.aws_region = "us-east-1"
-    settings.bedrock_model_id = "us.anthropic.claude-3-5-haiku-20241022-v1:0"
-    return settings
+    return SimpleNamespace(
+        aws_access_key_id="test-key",
+        aws_secret_access_key="test-secret",
+        aws_region="us-east-1",
+        bedrock_model_id="us.anthropic.claude-3-5-haiku-20241022-v1:0",
+    )
 
 
 @pytest.fixture
@@ -72,19 +126,10 @@ class TestConsolidateMessages:
 
 
 class TestConverse:
-    @pytest.mark.asyncio
     async def test_converse_basic(self, client):
-        mock_boto_client = MagicMock()
-        mock_boto_client.converse.return_value = {
-            "output": {
-                "message": {
-                    "role": "assistant",
-                    "content": [{"text": "Hello!"}],
-                }
-            },
-            "stopReason": "end_turn",
-        }
-        client._client = mock_boto_client
+        snapshot = copy.deepcopy(CONVERSE_TEXT_RESPONSE)
+        stub = boto_stub(ret=CONVERSE_TEXT_RESPONSE)
+        client._client = stub
 
         result = await client.converse(
             messages=[{"role": "user", "content": "hi"}],
@@ -93,29 +138,13 @@ class TestConverse:
 
         assert result["stopReason"] == "end_turn"
         assert result["output"]["content"][0]["text"] == "Hello!"
-        mock_boto_client.converse.assert_called_once()
+        assert len(stub.calls) == 1
+        # The shared response is reused by later tests; converse() must not change it
+        assert CONVERSE_TEXT_RESPONSE == snapshot
 
-    @pytest.mark.asyncio
     async def test_converse_with_tools(self, client):
-        mock_boto_client = MagicMock()
-        mock_boto_client.converse.return_value = {
-            "output": {
-                "message": {
-                    "role": "assistant",
-                    "content": [
-                        {
-                            "toolUse": {
-                                "toolUseId": "tool-1",
-                                "name": "get_whoop_summary",
-                                "input": {},
-                            }
-                        }
-                    ],
-                }
-            },
-            "stopReason": "tool_use",
-        }
-        client._client = mock_boto_client
+        stub = boto_stub(ret=CONVERSE_TOOL_USE_RESPONSE)
+        client._client = stub
 
         tools = [{"toolSpec": {"name": "get_whoop_summary", "description": "test"}}]
         result = await client.converse(
@@ -125,34 +154,34 @@ class TestConverse:
         )
 
         assert result["stopReason"] == "tool_use"
-        call_kwargs = mock_boto_client.converse.call_args[1]
-        assert "toolConfig" in call_kwargs
+        assert stub.calls[-1]["toolConfig"] == {"tools": tools}
 
-    @pytest.mark.asyncio
     async def test_converse_no_tools_omits_tool_config(self, client):
-        mock_boto_client = MagicMock()
-        mock_boto_client.converse.return_value = {
-            "output": {"message": {"role": "assistant", "content": [{"text": "hi"}]}},
-            "stopReason": "end_turn",
-        }
-        client._client = mock_boto_client
+        stub = boto_stub(ret=CONVERSE_TEXT_RESPONSE)
+        client._client = stub
 
         await client.converse(
             messages=[{"role": "user", "content": "hi"}],
             system_prompt="test",
         )
 
-        call_kwargs = mock_boto_client.converse.call_args[1]
-        assert "toolConfig" not in call_kwargs
+        assert "toolConfig" not in stub.calls[-1]
+
+    async def test_converse_throttling_error(self, client, monkeypatch):
+        delays = []
 
-    @pytest.mark.asyncio
-    async def test_converse_throttling_error(self, client):
-        mock_boto_client = MagicMock()
-        mock_boto_client.converse.side_effect = ClientError(
-            {"Error": {"Code": "ThrottlingException", "Message": "Rate exceeded"}},
-            "Converse",
+        async def fake_sleep(delay):
+            delays.append(delay)
+
+        # Skip the real 1s back-off before the retry. Only the client module
+        # sees the fake; the shared event loop keeps the real asyncio.sleep.
+        monkeypatch.setattr(
+            bedrock_client,
+            "asyncio",
+            SimpleNamespace(sleep=fake_sleep, to_thread=asyncio.to_thread),
         )
-        client._client = mock_boto_client
+        stub = boto_stub(exc=ClientError(THROTTLE_ERROR_RESPONSE, "Converse"))
+        client._client = stub
 
         with pytest.raises(BedrockAPIError) as exc_info:
             await client.converse(
@@ -160,12 +189,16 @@ class TestConverse:
                 system_prompt="test",
             )
         assert exc_info.value.status_code == 429
+        assert delays == [1]
+        assert len(stub.calls) == 2
 
-    @pytest.mark.asyncio
     async def test_converse_no_credentials(self):
-        settings = MagicMock()
-        settings.aws_access_key_id = ""
-        settings.aws_secret_access_key = ""
+        settings = SimpleNamespace(
+            aws_access_key_id="",
+            aws_secret_access_key="",
+            aws_region="us-east-1",
+            bedrock_model_id="us.anthropic.claude-3-5-haiku-20241022-v1:0",
+        )
         client = BedrockClient(settings=settings)
 
         with pytest.raises(BedrockAPIError) as exc_info:
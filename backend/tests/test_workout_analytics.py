@@ -1,30 +1,66 @@
 """Tests for workout analytics service methods."""
 
 import pytest
+from datetime import date
+from types import MappingProxyType, SimpleNamespace
 from unittest.mock import MagicMock
 from decimal import Decimal
 
 from app.services.workout_service import WorkoutService
 
+# Query range shared by every test; all fixture sessions fall in January 2024.
+START = date(2024, 1, 1)
+END = date(2024, 1, 31)
+# Analytics calls only pass the user id through to the mocked queries, so a
+# plain constant replaces the conftest fixture here.
+USER_ID = "test-user-123"
+
+
+class FakeQuery:
+    """Stand-in for a Supabase query builder whose execute() returns the given data."""
+
+    __slots__ = ("_data",)
+
+    def __init__(self, data):
+        self._data = data
+
+    def __getattr__(self, name):
+        # select/eq/in_/gte/lte/order/... all chain back to the same query
+        return lambda *args, **kwargs: self
+
+    def execute(self):
+        return SimpleNamespace(data=self._data)
+
+
+# FakeQuery keeps no per-call state, so chains can be shared between calls
+_EMPTY_CHAIN = FakeQuery([])
+
 
 def make_chain(data=None):
-    """Create a mock Supabase chain that returns the given data."""
-    chain = MagicMock()
-    chain.select.return_value = chain
-    chain.insert.return_value = chain
-    chain.update.return_value = chain
-    chain.delete.return_value = chain
-    chain.eq.return_value = chain
-    chain.in_.return_value = chain
-    chain.gte.return_value = chain
-    chain.lte.return_value = chain
-    chain.order.return_value = chain
-    chain.limit.return_value = chain
-    chain.or_.return_value = chain
-    result = MagicMock()
-    result.data = data or []
-    chain.execute.return_value = result
-    return chain
+    """Create a fake Supabase chain that returns the given data."""
+    return FakeQuery(data) if data else _EMPTY_CHAIN
+
+
+def empty_table(name):
+    """table() side effect for a database with no rows."""
+    return _EMPTY_CHAIN
+
+
+def make_table_side_effect(sessions_data, sets_data):
+    """Route table() calls to chains returning the given sessions and sets."""
+    if not sessions_data and not sets_data:
+        return empty_table
+    chains = {
+        "workout_sessions": make_chain(sessions_data),
+        "workout_sets": make_chain(sets_data),
+    }
+    return lambda name: chains.get(name, _EMPTY_CHAIN)
+
+
+def assert_points(result, expected):
+    """Assert each result point contains the expected subset of fields."""
+    assert len(result) == len(expected)
+    assert [{k: point[k] for k in exp} for point, exp in zip(result, expected)] == expected
 
 
 @pytest.fixture
@@ -40,142 +76,208 @@ def service(mock_supabase):
     return WorkoutService(supabase=mock_supabase)
 
 
-class TestGetExerciseHistory:
-    @pytest.mark.asyncio
-    async def test_aggregation(self, service, mock_supabase, user_id):
-        """Test that weight, volume, reps, RPE are computed correctly."""
-        sessions_data = [
-            {"id": "s1", "session_date": "2024-01-15"},
-        ]
-        sets_data = [
-            {"session_id": "s1", "weight_kg": Decimal("100"), "reps": 5, "rpe": Decimal("8")},
-            {"session_id": "s1", "weight_kg": Decimal("110"), "reps": 3, "rpe": Decimal("9")},
-            {"session_id": "s1", "weight_kg": Decimal("90"), "reps": 8, "rpe": None},
-        ]
+def frozen_rows(rows):
+    """Read-only copy of fixture rows, so a mutating service fails loudly."""
+    return tuple(MappingProxyType(row) for row in rows)
 
-        call_count = [0]
 
-        def table_side_effect(name):
-            if name == "workout_sessions":
-                return make_chain(sessions_data)
-            elif name == "workout_sets":
-                return make_chain(sets_data)
-            return make_chain()
+def freeze_cases(cases):
+    """Freeze the session and set rows of each pytest.param case."""
+    frozen = []
+    for case in cases:
+        sessions, sets, expected = case.values
+        frozen.append(pytest.param(frozen_rows(sessions), frozen_rows(sets), expected, id=case.id))
+    return frozen
 
-        mock_supabase.admin_client.table.side_effect = table_side_effect
 
-        from datetime import date
-        result = await service.get_exercise_history(
-            user_id, "ex-1", date(2024, 1, 1), date(2024, 1, 31)
-        )
+# One session holding every set in the single-day cases
+SINGLE_SESSION = ({"id": "s1", "session_date": "2024-01-15"},)
 
-        assert len(result) == 1
-        point = result[0]
-        assert point["date"] == "2024-01-15"
-        assert point["max_weight_kg"] == 110.0
-        # Volume: 100*5 + 110*3 + 90*8 = 500 + 330 + 720 = 1550
-        assert point["total_volume_kg"] == 1550.0
-        # Reps: 5 + 3 + 8 = 16
-        assert point["total_reps"] == 16
-        # RPE: (8 + 9) / 2 = 8.5
-        assert point["avg_rpe"] == 8.5
-        assert point["total_sets"] == 3
-
-    @pytest.mark.asyncio
-    async def test_grouping_by_date(self, service, mock_supabase, user_id):
-        """Test that sets from different sessions on the same date aggregate together."""
-        sessions_data = [
+
+def cardio_set(**overrides):
+    """Cardio set row in session s1; unset metrics default to empty."""
+    row = {
+        "session_id": "s1",
+        "distance_meters": None,
+        "duration_seconds": 0,
+        "avg_heart_rate": None,
+        "calories_burned": None,
+    }
+    row.update(overrides)
+    return row
+
+
+# (sessions, sets, expected points as field subsets), keyed by pytest id
+EXERCISE_HISTORY_CASES = freeze_cases([
+    pytest.param(
+        # Volume: 100*5 + 110*3 + 90*8 = 1550; reps: 16; RPE: (8 + 9) / 2 = 8.5
+        SINGLE_SESSION,
+        [
+            {"session_id": "s1", "weight_kg": Decimal("100"), "reps": 5, "rpe": Decimal("8")},
+            {"session_id": "s1", "weight_kg": Decimal("110"), "reps": 3, "rpe": Decimal("9")},
+            {"session_id": "s1", "weight_kg": Decimal("90"), "reps": 8, "rpe": None},
+        ],
+        [
+            {
+                "date": "2024-01-15",
+                "max_weight_kg": 110.0,
+                "total_volume_kg": 1550.0,
+                "total_reps": 16,
+                "avg_rpe": 8.5,
+                "total_sets": 3,
+            },
+        ],
+        id="aggregation",
+    ),
+    pytest.param(
+        # Sessions on the same date aggregate together
+        [
             {"id": "s1", "session_date": "2024-01-15"},
             {"id": "s2", "session_date": "2024-01-15"},
             {"id": "s3", "session_date": "2024-01-16"},
-        ]
-        sets_data = [
+        ],
+        [
             {"session_id": "s1", "weight_kg": Decimal("100"), "reps": 5, "rpe": None},
             {"session_id": "s2", "weight_kg": Decimal("105"), "reps": 5, "rpe": None},
             {"session_id": "s3", "weight_kg": Decimal("80"), "reps": 10, "rpe": None},
-        ]
-
-        def table_side_effect(name):
-            if name == "workout_sessions":
-                return make_chain(sessions_data)
-            elif name == "workout_sets":
-                return make_chain(sets_data)
-            return make_chain()
-
-        mock_supabase.admin_client.table.side_effect = table_side_effect
-
-        from datetime import date
-        result = await service.get_exercise_history(
-            user_id, "ex-1", date(2024, 1, 1), date(2024, 1, 31)
-        )
-
-        assert len(result) == 2
-        # Jan 15: max_weight 105, total_reps 10
-        assert result[0]["date"] == "2024-01-15"
-        assert result[0]["max_weight_kg"] == 105.0
-        assert result[0]["total_reps"] == 10
-        # Jan 16: max_weight 80, total_reps 10
-        assert result[1]["date"] == "2024-01-16"
-        assert result[1]["max_weight_kg"] == 80.0
-        assert result[1]["total_reps"] == 10
-
-    @pytest.mark.asyncio
-    async def test_empty_result(self, service, mock_supabase, user_id):
-        """Test that no sessions returns empty list."""
-        mock_supabase.admin_client.table.side_effect = lambda name: make_chain([])
-
-        from datetime import date
-        result = await service.get_exercise_history(
-            user_id, "ex-1", date(2024, 1, 1), date(2024, 1, 31)
-        )
-
-        assert result == []
-
-    @pytest.mark.asyncio
-    async def test_no_sets_for_exercise(self, service, mock_supabase, user_id):
-        """Test that sessions exist but no sets for exercise returns empty list."""
-        sessions_data = [
-            {"id": "s1", "session_date": "2024-01-15"},
-        ]
-
-        call_count = [0]
+        ],
+        [
+            {"date": "2024-01-15", "max_weight_kg": 105.0, "total_reps": 10},
+            {"date": "2024-01-16", "max_weight_kg": 80.0, "total_reps": 10},
+        ],
+        id="grouping_by_date",
+    ),
+    pytest.param([], [], [], id="empty_result"),
+    pytest.param(
+        SINGLE_SESSION,
+        [],
+        [],
+        id="no_sets_for_exercise",
+    ),
+])
+
+CARDIO_HISTORY_CASES = freeze_cases([
+    pytest.param(
+        SINGLE_SESSION,
+        [
+            cardio_set(distance_meters=Decimal("5000"), duration_seconds=1500, avg_heart_rate=150, calories_burned=400),
+            cardio_set(distance_meters=Decimal("3000"), duration_seconds=1000, avg_heart_rate=140, calories_burned=250),
+        ],
+        [
+            {
+                "total_distance_meters": 8000.0,
+                "total_duration_seconds": 2500,
+                "total_calories": 650,
+                "total_sets": 2,
+            },
+        ],
+        id="aggregation",
+    ),
+    pytest.param(
+        # 3000s / (10000m / 1000) = 300 s/km = 5:00/km
+        SINGLE_SESSION,
+        [
+            cardio_set(distance_meters=Decimal("10000"), duration_seconds=3000),
+        ],
+        [{"avg_pace_seconds_per_km": 300}],
+        id="pace_calculation",
+    ),
+    pytest.param(
+        # Duration-weighted: (160*1000 + 140*3000) / (1000+3000) = 145
+        SINGLE_SESSION,
+        [
+            cardio_set(distance_meters=Decimal("5000"), duration_seconds=1000, avg_heart_rate=160),
+            cardio_set(distance_meters=Decimal("5000"), duration_seconds=3000, avg_heart_rate=140),
+        ],
+        [{"avg_heart_rate": 145}],
+        id="weighted_heart_rate",
+    ),
+    pytest.param([], [], [], id="empty_result"),
+])
+
+WORKOUT_TRENDS_CASES = freeze_cases([
+    pytest.param(
+        # Mon Jan 15 and Wed Jan 17, 2024 share ISO week W03.
+        # Volume: 100*5 + 80*10 = 1300; duration: 60 + 30 = 90 minutes
+        [
+            {"id": "s1", "session_date": "2024-01-15", "start_time": "2024-01-15T08:00:00", "end_time": "2024-01-15T09:00:00"},
+            {"id": "s2", "session_date": "2024-01-17", "start_time": "2024-01-17T08:00:00", "end_time": "2024-01-17T08:30:00"},
+        ],
+        [
+            {"session_id": "s1", "weight_kg": Decimal("100"), "reps": 5, "distance_meters": None},
+            {"session_id": "s2", "weight_kg": Decimal("80"), "reps": 10, "distance_meters": None},
+        ],
+        [
+            {
+                "week": "2024-W03",
+                "total_sessions": 2,
+                "total_sets": 2,
+                "total_volume_kg": 1300.0,
+                "total_duration_minutes": 90.0,
+            },
+        ],
+        id="weekly_grouping",
+    ),
+    pytest.param(
+        # Sun Jan 14, 2024 = W02, Mon Jan 15, 2024 = W03
+        [
+            {"id": "s1", "session_date": "2024-01-14", "start_time": None, "end_time": None},
+            {"id": "s2", "session_date": "2024-01-15", "start_time": None, "end_time": None},
+        ],
+        [
+            {"session_id": "s1", "weight_kg": Decimal("50"), "reps": 10, "distance_meters": None},
+            {"session_id": "s2", "weight_kg": Decimal("60"), "reps": 10, "distance_meters": None},
+        ],
+        [
+            {"week": "2024-W02", "total_sessions": 1, "total_volume_kg": 500.0},
+            {"week": "2024-W03", "total_sessions": 1, "total_volume_kg": 600.0},
+        ],
+        id="cross_week_boundary",
+    ),
+    pytest.param(
+        # Strength volume and cardio distance both appear
+        [{"id": "s1", "session_date": "2024-01-15", "start_time": None, "end_time": None}],
+        [
+            {"session_id": "s1", "weight_kg": Decimal("100"), "reps": 5, "distance_meters": None},
+            {"session_id": "s1", "weight_kg": None, "reps": None, "distance_meters": Decimal("5000")},
+        ],
+        [{"total_volume_kg": 500.0, "total_distance_meters": 5000.0, "total_sets": 2}],
+        id="mixed_strength_cardio",
+    ),
+    pytest.param([], [], [], id="empty_result"),
+])
+
+
+DECIMAL_SESSIONS = frozen_rows(SINGLE_SESSION)
+DECIMAL_SETS = frozen_rows([
+    {"session_id": "s1", "weight_kg": Decimal("67.5"), "reps": 10, "rpe": Decimal("7.5")},
+])
 
-        def table_side_effect(name):
-            if name == "workout_sessions":
-                return make_chain(sessions_data)
-            elif name == "workout_sets":
-                return make_chain([])
-            return make_chain()
 
-        mock_supabase.admin_client.table.side_effect = table_side_effect
+class TestGetExerciseHistory:
+    @pytest.mark.parametrize(
+        "sessions_data,sets_data,expected",
+        EXERCISE_HISTORY_CASES,
+    )
+    async def test_history(
+        self, service, mock_supabase, sessions_data, sets_data, expected
+    ):
+        mock_supabase.admin_client.table.side_effect = make_table_side_effect(sessions_data, sets_data)
 
-        from datetime import date
         result = await service.get_exercise_history(
-            user_id, "ex-1", date(2024, 1, 1), date(2024, 1, 31)
+            USER_ID, "ex-1", START, END
         )
 
-        assert result == []
+        assert_points(result, expected)
 
-    @pytest.mark.asyncio
-    async def test_decimal_to_float_conversion(self, service, mock_supabase, user_id):
+    async def test_decimal_to_float_conversion(self, service, mock_supabase):
         """Test that Decimal values are converted to float."""
-        sessions_data = [{"id": "s1", "session_date": "2024-01-15"}]
-        sets_data = [
-            {"session_id": "s1", "weight_kg": Decimal("67.5"), "reps": 10, "rpe": Decimal("7.5")},
-        ]
-
-        def table_side_effect(name):
-            if name == "workout_sessions":
-                return make_chain(sessions_data)
-            elif name == "workout_sets":
-                return make_chain(sets_data)
-            return make_chain()
-
-        mock_supabase.admin_client.table.side_effect = table_side_effect
+        mock_supabase.admin_client.table.side_effect = make_table_side_effect(
+            DECIMAL_SESSIONS, DECIMAL_SETS
+        )
 
-        from datetime import date
         result = await service.get_exercise_history(
-            user_id, "ex-1", date(2024, 1, 1), date(2024, 1, 31)
+            USER_ID, "ex-1", START, END
         )
 
         point = result[0]
@@ -188,244 +290,34 @@ class TestGetExerciseHistory:
 
 
 class TestGetCardioHistory:
-    @pytest.mark.asyncio
-    async def test_aggregation(self, service, mock_supabase, user_id):
-        """Test distance, duration, calories aggregation."""
-        sessions_data = [{"id": "s1", "session_date": "2024-01-15"}]
-        sets_data = [
-            {
-                "session_id": "s1",
-                "distance_meters": Decimal("5000"),
-                "duration_seconds": 1500,
-                "avg_heart_rate": 150,
-                "calories_burned": 400,
-            },
-            {
-                "session_id": "s1",
-                "distance_meters": Decimal("3000"),
-                "duration_seconds": 1000,
-                "avg_heart_rate": 140,
-                "calories_burned": 250,
-            },
-        ]
-
-        def table_side_effect(name):
-            if name == "workout_sessions":
-                return make_chain(sessions_data)
-            elif name == "workout_sets":
-                return make_chain(sets_data)
-            return make_chain()
-
-        mock_supabase.admin_client.table.side_effect = table_side_effect
-
-        from datetime import date
-        result = await service.get_cardio_history(
-            user_id, "ex-1", date(2024, 1, 1), date(2024, 1, 31)
-        )
+    @pytest.mark.parametrize(
+        "sessions_data,sets_data,expected",
+        CARDIO_HISTORY_CASES,
+    )
+    async def test_history(
+        self, service, mock_supabase, sessions_data, sets_data, expected
+    ):
+        mock_supabase.admin_client.table.side_effect = make_table_side_effect(sessions_data, sets_data)
 
-        assert len(result) == 1
-        point = result[0]
-        assert point["total_distance_meters"] == 8000.0
-        assert point["total_duration_seconds"] == 2500
-        assert point["total_calories"] == 650
-        assert point["total_sets"] == 2
-
-    @pytest.mark.asyncio
-    async def test_pace_calculation(self, service, mock_supabase, user_id):
-        """Test avg pace = total_duration / (total_distance/1000)."""
-        sessions_data = [{"id": "s1", "session_date": "2024-01-15"}]
-        sets_data = [
-            {
-                "session_id": "s1",
-                "distance_meters": Decimal("10000"),
-                "duration_seconds": 3000,
-                "avg_heart_rate": None,
-                "calories_burned": None,
-            },
-        ]
-
-        def table_side_effect(name):
-            if name == "workout_sessions":
-                return make_chain(sessions_data)
-            elif name == "workout_sets":
-                return make_chain(sets_data)
-            return make_chain()
-
-        mock_supabase.admin_client.table.side_effect = table_side_effect
-
-        from datetime import date
         result = await service.get_cardio_history(
-            user_id, "ex-1", date(2024, 1, 1), date(2024, 1, 31)
+            USER_ID, "ex-1", START, END
         )
 
-        point = result[0]
-        # 3000s / (10000m / 1000) = 3000/10 = 300 s/km = 5:00/km
-        assert point["avg_pace_seconds_per_km"] == 300
-
-    @pytest.mark.asyncio
-    async def test_weighted_heart_rate(self, service, mock_supabase, user_id):
-        """Test duration-weighted heart rate average."""
-        sessions_data = [{"id": "s1", "session_date": "2024-01-15"}]
-        sets_data = [
-            {
-                "session_id": "s1",
-                "distance_meters": Decimal("5000"),
-                "duration_seconds": 1000,
-                "avg_heart_rate": 160,
-                "calories_burned": None,
-            },
-            {
-                "session_id": "s1",
-                "distance_meters": Decimal("5000"),
-                "duration_seconds": 3000,
-                "avg_heart_rate": 140,
-                "calories_burned": None,
-            },
-        ]
-
-        def table_side_effect(name):
-            if name == "workout_sessions":
-                return make_chain(sessions_data)
-            elif name == "workout_sets":
-                return make_chain(sets_data)
-            return make_chain()
-
-        mock_supabase.admin_client.table.side_effect = table_side_effect
-
-        from datetime import date
-        result = await service.get_cardio_history(
-            user_id, "ex-1", date(2024, 1, 1), date(2024, 1, 31)
-        )
-
-        point = result[0]
-        # Weighted: (160*1000 + 140*3000) / (1000+3000) = (160000+420000)/4000 = 145
-        assert point["avg_heart_rate"] == 145
-
-    @pytest.mark.asyncio
-    async def test_empty_result(self, service, mock_supabase, user_id):
-        """Test no sessions returns empty list."""
-        mock_supabase.admin_client.table.side_effect = lambda name: make_chain([])
-
-        from datetime import date
-        result = await service.get_cardio_history(
-            user_id, "ex-1", date(2024, 1, 1), date(2024, 1, 31)
-        )
-
-        assert result == []
+        assert_points(result, expected)
 
 
 class TestGetWorkoutTrends:
-    @pytest.mark.asyncio
-    async def test_weekly_grouping(self, service, mock_supabase, user_id):
-        """Test sessions on different days in the same week aggregate together."""
-        # Mon Jan 15, 2024 and Wed Jan 17, 2024 are same ISO week (W03)
-        sessions_data = [
-            {"id": "s1", "session_date": "2024-01-15", "start_time": "2024-01-15T08:00:00", "end_time": "2024-01-15T09:00:00"},
-            {"id": "s2", "session_date": "2024-01-17", "start_time": "2024-01-17T08:00:00", "end_time": "2024-01-17T08:30:00"},
-        ]
-        sets_data = [
-            {"session_id": "s1", "set_type": "strength", "weight_kg": Decimal("100"), "reps": 5, "distance_meters": None, "duration_seconds": None},
-            {"session_id": "s2", "set_type": "strength", "weight_kg": Decimal("80"), "reps": 10, "distance_meters": None, "duration_seconds": None},
-        ]
-
-        def table_side_effect(name):
-            if name == "workout_sessions":
-                return make_chain(sessions_data)
-            elif name == "workout_sets":
-                return make_chain(sets_data)
-            return make_chain()
-
-        mock_supabase.admin_client.table.side_effect = table_side_effect
-
-        from datetime import date
-        result = await service.get_workout_trends(
-            user_id, date(2024, 1, 1), date(2024, 1, 31)
-        )
-
-        assert len(result) == 1
-        week = result[0]
-        assert week["week"] == "2024-W03"
-        assert week["total_sessions"] == 2
-        assert week["total_sets"] == 2
-        # Volume: 100*5 + 80*10 = 500 + 800 = 1300
-        assert week["total_volume_kg"] == 1300.0
-        # Duration: 60 + 30 = 90 minutes
-        assert week["total_duration_minutes"] == 90.0
-
-    @pytest.mark.asyncio
-    async def test_cross_week_boundary(self, service, mock_supabase, user_id):
-        """Test sessions in different weeks produce separate data points."""
-        # Sun Jan 14, 2024 = W02, Mon Jan 15, 2024 = W03
-        sessions_data = [
-            {"id": "s1", "session_date": "2024-01-14", "start_time": None, "end_time": None},
-            {"id": "s2", "session_date": "2024-01-15", "start_time": None, "end_time": None},
-        ]
-        sets_data = [
-            {"session_id": "s1", "set_type": "strength", "weight_kg": Decimal("50"), "reps": 10, "distance_meters": None, "duration_seconds": None},
-            {"session_id": "s2", "set_type": "strength", "weight_kg": Decimal("60"), "reps": 10, "distance_meters": None, "duration_seconds": None},
-        ]
-
-        def table_side_effect(name):
-            if name == "workout_sessions":
-                return make_chain(sessions_data)
-            elif name == "workout_sets":
-                return make_chain(sets_data)
-            return make_chain()
-
-        mock_supabase.admin_client.table.side_effect = table_side_effect
-
-        from datetime import date
-        result = await service.get_workout_trends(
-            user_id, date(2024, 1, 1), date(2024, 1, 31)
-        )
-
-        assert len(result) == 2
-        assert result[0]["week"] == "2024-W02"
-        assert result[0]["total_sessions"] == 1
-        assert result[0]["total_volume_kg"] == 500.0
-        assert result[1]["week"] == "2024-W03"
-        assert result[1]["total_sessions"] == 1
-        assert result[1]["total_volume_kg"] == 600.0
-
-    @pytest.mark.asyncio
-    async def test_mixed_strength_cardio(self, service, mock_supabase, user_id):
-        """Test that strength volume and cardio distance both appear."""
-        sessions_data = [
-            {"id": "s1", "session_date": "2024-01-15", "start_time": None, "end_time": None},
-        ]
-        sets_data = [
-            {"session_id": "s1", "set_type": "strength", "weight_kg": Decimal("100"), "reps": 5, "distance_meters": None, "duration_seconds": None},
-            {"session_id": "s1", "set_type": "cardio", "weight_kg": None, "reps": None, "distance_meters": Decimal("5000"), "duration_seconds": 1500},
-        ]
-
-        def table_side_effect(name):
-            if name == "workout_sessions":
-                return make_chain(sessions_data)
-            elif name == "workout_sets":
-                return make_chain(sets_data)
-            return make_chain()
-
-        mock_supabase.admin_client.table.side_effect = table_side_effect
-
-        from datetime import date
-        result = await service.get_workout_trends(
-            user_id, date(2024, 1, 1), date(2024, 1, 31)
-        )
-
-        assert len(result) == 1
-        week = result[0]
-        assert week["total_volume_kg"] == 500.0
-        assert week["total_distance_meters"] == 5000.0
-        assert week["total_sets"] == 2
-
-    @pytest.mark.asyncio
-    async def test_empty_result(self, service, mock_supabase, user_id):
-        """Test no sessions returns empty list."""
-        mock_supabase.admin_client.table.side_effect = lambda name: make_chain([])
+    @pytest.mark.parametrize(
+        "sessions_data,sets_data,expected",
+        WORKOUT_TRENDS_CASES,
+    )
+    async def test_trends(
+        self, service, mock_supabase, sessions_data, sets_data, expected
+    ):
+        mock_supabase.admin_client.table.side_effect = make_table_side_effect(sessions_data, sets_data)
 
-        from datetime import date
         result = await service.get_workout_trends(
-            user_id, date(2024, 1, 1), date(2024, 1, 31)
+            USER_ID, START, END
         )
 
-        assert result == []
+        assert_points(result, expected)